@@ -1,13 +1,20 @@
 import math
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Dict, List
 
 import numpy as np
 import pandas as pd
 import streamlit as st
 
+from core.cache import load_metrics, save_metrics
 from core.fetch import fetch_ticker_data
-from core.metrics import compute_metrics
-from profiles.investors import ALL_PROFILES, InvestorProfile
+from core.metrics import compute_metrics, stack_metrics
+from profiles.investors import (
+    ALL_PROFILES,
+    InvestorProfile,
+    evaluate_all,
+    summarize_batch,
+)
 
 
 # ------------------------------------------------------------
@@ -23,15 +30,33 @@ st.set_page_config(
 # ------------------------------------------------------------
 # Data loading / caching
 # ------------------------------------------------------------
+# Concurrent tickers in the screener. Each ticker fetches .info and history
+# in parallel, so this allows twice as many Yahoo requests in flight; higher
+# risks rate limiting.
+SCREENER_WORKERS = 8
+
+
 @st.cache_data(show_spinner=False)
 def get_ticker_data_cached(ticker: str) -> Dict[str, Any]:
-    return fetch_ticker_data(ticker)
+    raw = fetch_ticker_data(ticker)
+    # Empty info means Yahoo failed or rate-limited us. Raise rather than
+    # return it: st.cache_data doesn't cache exceptions, so the ticker is
+    # retried next time instead of showing up as all-NaN until a restart.
+    if not raw.get("info"):
+        raise RuntimeError(f"No data returned from Yahoo Finance for {ticker}")
+    return raw
 
 
 @st.cache_data(show_spinner=False)
 def get_metrics_cached(ticker: str) -> Dict[str, Any]:
-    raw = get_ticker_data_cached(ticker)
-    return compute_metrics(ticker, raw)
+    # Disk cache first so a restarted app doesn't refetch every ticker
+    metrics = load_metrics(ticker)
+    if metrics is None:
+        # Raises on a failed fetch, so nothing empty is cached here or on disk
+        raw = get_ticker_data_cached(ticker)
+        metrics = compute_metrics(ticker, raw)
+        save_metrics(ticker, metrics)
+    return metrics
 
 
 @st.cache_data(show_spinner=True)
@@ -273,9 +298,14 @@ with tab1:
                 "na": "❔",
             }
 
+            # All selected checklists share one pass over the metrics
+            results_by_key = evaluate_all(
+                metrics, [profile_key_map[label] for label in selected_profiles_labels]
+            )
+
             for label in selected_profiles_labels:
                 profile: InvestorProfile = profile_key_map[label]
-                result = profile.rules_fn(metrics)
+                result = results_by_key[profile.key]
 
                 summary = result.get("summary", {})
                 rules = result.get("rules", [])
@@ -374,17 +404,36 @@ with tab2:
         progress = st.progress(0, text="Running checklists across S&P 500...")
         total = len(work_df)
 
-        for i, row in enumerate(work_df.itertuples(index=False), start=1):
-            ticker = row.Ticker
-            company = row.Company
-            sector = row.Sector
-            industry = row.Industry
+        # Fetching is network-bound, so fan the tickers out over a thread pool
+        # and only then run the (cheap) checklists in universe order.
+        metrics_by_ticker: Dict[str, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=SCREENER_WORKERS) as pool:
+            futures = {
+                pool.submit(get_metrics_cached, t): t for t in work_df["Ticker"]
+            }
+            for i, future in enumerate(as_completed(futures), start=1):
+                try:
+                    metrics_by_ticker[futures[future]] = future.result()
+                except Exception:
+                    # Skip ticker if metrics can't be fetched
+                    pass
+                progress.progress(
+                    i / total,
+                    text=f"Running checklists across S&P 500... ({i}/{total})",
+                )
+
+        # Universe order, keeping only tickers whose metrics came back
+        universe_df = work_df[["Ticker", "Company", "Sector", "Industry"]]
+        universe_df = universe_df[universe_df["Ticker"].isin(metrics_by_ticker)]
 
-            try:
-                metrics = get_metrics_cached(ticker)
-            except Exception:
-                # Skip ticker if metrics can't be fetched
-                continue
+        # Score every ticker at once over columnar metrics (one array per
+        # field) instead of running each profile ticker by ticker.
+        columns = stack_metrics([metrics_by_ticker[t] for t in universe_df["Ticker"]])
+        counts = summarize_batch(columns, selected_profiles)
+
+        # Walk the universe as a plain object ndarray; no per-row pandas objects.
+        universe_rows = universe_df.to_numpy()
+        for i, (ticker, company, sector, industry) in enumerate(universe_rows):
 
             total_passes = 0
             total_warns = 0
@@ -393,14 +442,10 @@ with tab2:
             per_profile_passes: Dict[str, int] = {}
 
             for p in selected_profiles:
-                try:
-                    res = p.rules_fn(metrics)
-                    summary = res.get("summary", {})
-                    passes = int(summary.get("passes", 0))
-                    warns = int(summary.get("warns", 0))
-                    fails = int(summary.get("fails", 0))
-                except Exception:
-                    passes = warns = fails = 0
+                profile_counts = counts[p.key]
+                passes = int(profile_counts["passes"][i])
+                warns = int(profile_counts["warns"][i])
+                fails = int(profile_counts["fails"][i])
 
                 total_passes += passes
                 total_warns += warns
@@ -431,11 +476,6 @@ with tab2:
 
             results_rows.append(row_dict)
 
-            progress.progress(
-                i / total,
-                text=f"Running checklists across S&P 500... ({i}/{total})",
-            )
-
         progress.empty()
 
         if not results_rows:
@@ -0,0 +1,63 @@
+import os
+import pickle
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# On-disk cache of computed metrics so a restarted app doesn't refetch
+# every ticker from Yahoo. Entries older than the TTL are ignored.
+CACHE_DIR = Path(
+    os.environ.get(
+        "SUPERINVESTOR_CACHE_DIR", Path.home() / ".cache" / "superinvestor"
+    )
+)
+# Seconds; set SUPERINVESTOR_CACHE_TTL=0 to disable the disk cache.
+CACHE_TTL = int(os.environ.get("SUPERINVESTOR_CACHE_TTL", 6 * 3600))
+
+
+# Yahoo symbols: letters, digits and . - ^ = (e.g. BRK-B, ^GSPC, EURUSD=X).
+# Anything else could escape CACHE_DIR, so it never touches the disk.
+_TICKER_RE = re.compile(r"[A-Z0-9.\-^=]{1,15}")
+
+
+def _path(ticker: str) -> Optional[Path]:
+    """Cache file for `ticker`, or None if it isn't a plausible symbol."""
+    symbol = ticker.upper().strip()
+    if not _TICKER_RE.fullmatch(symbol) or symbol in (".", ".."):
+        return None
+    return CACHE_DIR / f"{symbol}.pkl"
+
+
+def load_metrics(ticker: str) -> Optional[Dict[str, Any]]:
+    """Cached metrics for `ticker`, or None if missing, stale or unreadable."""
+    if CACHE_TTL <= 0:
+        return None
+    path = _path(ticker)
+    if path is None:
+        return None
+    try:
+        if time.time() - path.stat().st_mtime > CACHE_TTL:
+            return None
+        with path.open("rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def save_metrics(ticker: str, metrics: Dict[str, Any]) -> None:
+    """Best-effort write; a failed write just means a cache miss next time."""
+    if CACHE_TTL <= 0:
+        return
+    path = _path(ticker)
+    if path is None:
+        return
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tmp.open("wb") as f:
+            pickle.dump(metrics, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except Exception:
+        tmp.unlink(missing_ok=True)
@@ -1,9 +1,24 @@
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable
 
 import pandas as pd
 import yfinance as yf
 
 
+def _fetch_info(tk: yf.Ticker) -> Dict[str, Any]:
+    try:
+        return tk.info or {}
+    except Exception:
+        return {}
+
+
+def _fetch_history(tk: yf.Ticker) -> pd.DataFrame:
+    try:
+        return tk.history(period="5y", interval="1d", auto_adjust=True)
+    except Exception:
+        return pd.DataFrame()
+
+
 def fetch_ticker_data(ticker: str) -> Dict[str, Any]:
     """
     Fetch raw data for a single ticker from Yahoo Finance via yfinance.
@@ -15,14 +30,27 @@ def fetch_ticker_data(ticker: str) -> Dict[str, Any]:
     ticker = ticker.upper().strip()
     tk = yf.Ticker(ticker)
 
-    try:
-        info = tk.info or {}
-    except Exception:
-        info = {}
-
-    try:
-        history = tk.history(period="5y", interval="1d", auto_adjust=True)
-    except Exception:
-        history = pd.DataFrame()
+    # .info and .history hit separate Yahoo endpoints, so overlap the two
+    # round-trips instead of paying for them back to back.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        info_future = pool.submit(_fetch_info, tk)
+        history_future = pool.submit(_fetch_history, tk)
+        info = info_future.result()
+        history = history_future.result()
 
     return {"info": info, "history": history}
+
+
+def fetch_ticker_data_many(
+    tickers: Iterable[str], max_workers: int = 16
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch raw data for many tickers concurrently.
+
+    The work is network-bound, so a thread pool overlaps the Yahoo round-trips.
+    Returns {ticker: fetch_ticker_data(ticker)} keyed by the cleaned ticker.
+    """
+    symbols = list(dict.fromkeys(t.upper().strip() for t in tickers))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = pool.map(fetch_ticker_data, symbols)
+        return dict(zip(symbols, results))
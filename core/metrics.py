@@ -1,17 +1,95 @@
-from typing import Any, Dict
+from contextlib import suppress
+from typing import Any, Dict, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
 
 
-def _safe_div(a: Any, b: Any) -> float:
+# Every numeric (section, key) pair produced by compute_metrics.
+METRIC_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("valuation", "pe"),
+    ("valuation", "pb"),
+    ("valuation", "ev_ebitda"),
+    ("valuation", "ev_sales"),
+    ("valuation", "earnings_yield"),
+    ("valuation", "fcf_yield"),
+    ("valuation", "peg"),
+    ("quality", "roe"),
+    ("quality", "roa"),
+    ("quality", "gross_margin"),
+    ("quality", "op_margin"),
+    ("quality", "net_margin"),
+    ("quality", "fcf_conversion"),
+    ("growth", "revenue_growth"),
+    ("growth", "earnings_growth"),
+    ("balance_sheet", "debt_to_equity"),
+    ("balance_sheet", "current_ratio"),
+    ("balance_sheet", "quick_ratio"),
+    ("balance_sheet", "interest_coverage"),
+    ("dividends", "dividend_yield"),
+    ("dividends", "payout_ratio"),
+)
+
+# Plain numeric .info fields, unpacked in this order by compute_metrics.
+_INFO_FLOAT_KEYS: Tuple[str, ...] = (
+    "priceToBook",
+    "returnOnEquity",
+    "returnOnAssets",
+    "grossMargins",
+    "operatingMargins",
+    "profitMargins",
+    "revenueGrowth",
+    "earningsGrowth",
+    "debtToEquity",
+    "currentRatio",
+    "quickRatio",
+    "interestCoverage",
+    "dividendYield",
+    "trailingAnnualDividendYield",
+    "payoutRatio",
+)
+
+# Fallback chains for fields Yahoo reports under more than one key.
+_NET_INCOME_KEYS: Tuple[str, ...] = ("netIncomeToCommon", "netIncome", "profit")
+_NAME_KEYS: Tuple[str, ...] = ("shortName", "longName")
+
+
+def _safe_div(a: Any, b: Any) -> np.float64:
     """Safe division that returns NaN instead of blowing up."""
+    # b != b is the NaN test; no try/except needed for numeric inputs.
+    if a is None or b is None or b == 0 or b != b:
+        return np.float64(np.nan)
+    return np.float64(a) / b
+
+
+def _safe_div_vec(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Element-wise _safe_div: NaN wherever b is zero or either side is NaN."""
+    out = np.full(np.broadcast(a, b).shape, np.nan)
+    np.divide(a, b, out=out, where=(b != 0) & ~np.isnan(b))
+    return out
+
+
+def _info_floats(info: Dict[str, Any], keys: Tuple[str, ...]) -> np.ndarray:
+    """Read `keys` from `info` into one float64 array; None/missing -> NaN."""
+    values = [info.get(key) for key in keys]
     try:
-        if b in (0, None) or (isinstance(b, float) and np.isnan(b)):
-            return float("nan")
-        return float(a) / float(b)
-    except Exception:
-        return float("nan")
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        # A stray non-numeric value; fall back to converting one by one.
+        out = np.full(len(values), np.nan)
+        for i, val in enumerate(values):
+            with suppress(TypeError, ValueError):
+                out[i] = val
+        return out
+
+
+def _coalesce(info: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """First truthy value among `keys` in `info`, else None."""
+    for key in keys:
+        val = info.get(key)
+        if val:
+            return val
+    return None
 
 
 def compute_metrics(ticker: str, raw: Dict[str, Any]) -> Dict[str, Any]:
@@ -33,105 +111,100 @@ def compute_metrics(ticker: str, raw: Dict[str, Any]) -> Dict[str, Any]:
         history = pd.DataFrame()
     # history is always a DataFrame (maybe empty)
 
+    # All plain numeric .info fields in one pass (None/missing -> NaN)
+    (
+        pb,
+        roe,  # ratio, e.g. 0.15 = 15%
+        roa,
+        gross_margin,
+        op_margin,
+        net_margin,
+        rev_growth,  # e.g. 0.08 = 8%
+        earnings_growth,
+        debt_to_equity,  # often % style
+        current_ratio,
+        quick_ratio,
+        interest_cover,
+        dividend_yield,  # e.g. 0.025 = 2.5%
+        trailing_yield,
+        payout_ratio,  # e.g. 0.4 = 40%
+    ) = _info_floats(info, _INFO_FLOAT_KEYS)
+
     # ----- Basic price / size -----
     price = info.get("currentPrice")
     if price is None and not history.empty and "Close" in history.columns:
-        try:
-            price = float(history["Close"].iloc[-1])
-        except Exception:
-            price = None
+        # Read the tail straight off the ndarray; skip trailing NaN bars.
+        closes = np.empty(0)
+        with suppress(TypeError, ValueError):
+            closes = history["Close"].to_numpy(dtype=np.float64)
+        closes = closes[~np.isnan(closes)]
+        price = float(closes[-1]) if closes.size else None
 
+    # Only derive market cap from shares when Yahoo didn't report it directly
     market_cap = info.get("marketCap")
-    shares_out = info.get("sharesOutstanding")
-    if market_cap is None and price is not None and shares_out:
-        market_cap = price * shares_out
+    if market_cap is None and price is not None:
+        shares_out = info.get("sharesOutstanding")
+        if shares_out:
+            market_cap = price * shares_out
 
     enterprise_value = info.get("enterpriseValue")
 
+    net_income = _coalesce(info, _NET_INCOME_KEYS)
+
     # Try to use direct PE first, then fall back to our own calc
     pe = info.get("trailingPE")
-    if pe is None:
-        net_income = (
-            info.get("netIncomeToCommon")
-            or info.get("netIncome")
-            or info.get("profit")
-        )
-        if net_income:
-            pe = _safe_div(market_cap, net_income)
+    if pe is None and net_income:
+        pe = _safe_div(market_cap, net_income)
     if pe is None:
         pe = float("nan")
 
-    pb = info.get("priceToBook", float("nan"))
-
     ebitda = info.get("ebitda")
     total_revenue = info.get("totalRevenue")
     free_cash_flow = info.get("freeCashflow")
 
-    ev_ebitda = _safe_div(enterprise_value, ebitda) if ebitda else float("nan")
-    ev_sales = _safe_div(enterprise_value, total_revenue) if total_revenue else float(
-        "nan"
+    ev_ebitda = _safe_div(enterprise_value, ebitda) if ebitda else np.float64(np.nan)
+    ev_sales = (
+        _safe_div(enterprise_value, total_revenue)
+        if total_revenue
+        else np.float64(np.nan)
     )
 
     # Earnings yield: prefer 1 / P/E if we have it
     if pe and not np.isnan(pe) and pe > 0:
-        earnings_yield = 1.0 / float(pe)
+        earnings_yield = 1.0 / np.float64(pe)
     else:
-        earnings_yield = float("nan")
+        earnings_yield = np.float64(np.nan)
 
     fcf_yield = (
         _safe_div(free_cash_flow, market_cap)
         if (free_cash_flow and market_cap)
-        else float("nan")
+        else np.float64(np.nan)
     )
 
     # ----- Quality metrics -----
-    roe = info.get("returnOnEquity", float("nan"))  # ratio, e.g. 0.15 = 15%
-    roa = info.get("returnOnAssets", float("nan"))
-    gross_margin = info.get("grossMargins", float("nan"))
-    op_margin = info.get("operatingMargins", float("nan"))
-    net_margin = info.get("profitMargins", float("nan"))
-
-    net_income = (
-        info.get("netIncomeToCommon")
-        or info.get("netIncome")
-        or info.get("profit")
-    )
-
     fcf_conversion = (
         _safe_div(free_cash_flow, net_income)
         if (free_cash_flow and net_income)
-        else float("nan")
+        else np.float64(np.nan)
     )
 
     # ----- Growth metrics (YoY-ish, from info) -----
-    rev_growth = info.get("revenueGrowth", float("nan"))  # e.g. 0.08 = 8%
-    earnings_growth = info.get("earningsGrowth", float("nan"))
-
     # For a rough PEG, use earnings growth if available, else revenue
     growth_for_peg = earnings_growth if not np.isnan(earnings_growth) else rev_growth
-    peg_ratio = float("nan")
+    peg_ratio = np.float64(np.nan)
     if not np.isnan(pe) and not np.isnan(growth_for_peg) and growth_for_peg > 0:
         # growth_for_peg is in decimals (0.10 = 10%)
-        peg_ratio = pe / (growth_for_peg * 100.0)
+        peg_ratio = np.float64(pe) / (growth_for_peg * 100.0)
 
     # ----- Balance sheet / leverage metrics -----
-    debt_to_equity = info.get("debtToEquity", float("nan"))  # often % style
     # Convert to ratio if it looks like a percentage (e.g. 80 = 0.8)
-    if not np.isnan(debt_to_equity) and debt_to_equity > 10:
+    if debt_to_equity > 10:
         debt_to_equity = debt_to_equity / 100.0
 
-    current_ratio = info.get("currentRatio", float("nan"))
-    quick_ratio = info.get("quickRatio", float("nan"))
-    interest_cover = info.get("interestCoverage", float("nan"))
-
     # ----- Dividends -----
-    dividend_yield = info.get("dividendYield", float("nan"))  # e.g. 0.025 = 2.5%
     if np.isnan(dividend_yield):
-        # sometimes this one is filled instead
-        trailing_yield = info.get("trailingAnnualDividendYield", float("nan"))
-        if not np.isnan(trailing_yield):
-            dividend_yield = trailing_yield
-    payout_ratio = info.get("payoutRatio", float("nan"))  # e.g. 0.4 = 40%
+        # sometimes this one is filled instead (NaN stays NaN)
+        dividend_yield = trailing_yield
 
     # ----- Pack into a nested metrics dict -----
     metrics: Dict[str, Any] = {
@@ -141,12 +214,12 @@ def compute_metrics(ticker: str, raw: Dict[str, Any]) -> Dict[str, Any]:
             "market_cap": market_cap,
             "enterprise_value": enterprise_value,
             "currency": info.get("currency"),
-            "short_name": info.get("shortName") or info.get("longName"),
+            "short_name": _coalesce(info, _NAME_KEYS),
             "sector": info.get("sector"),
             "industry": info.get("industry"),
         },
         "valuation": {
-            "pe": float(pe),
+            "pe": np.float64(pe),
             "pb": pb,
             "ev_ebitda": ev_ebitda,
             "ev_sales": ev_sales,
@@ -179,3 +252,90 @@ def compute_metrics(ticker: str, raw: Dict[str, Any]) -> Dict[str, Any]:
     }
 
     return metrics
+
+
+def stack_metrics(metrics_list: Sequence[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Stack per-ticker metrics dicts into one float64 column per field.
+
+    Columns are keyed by field name (e.g. "pe", "roe") and row i comes from
+    metrics_list[i]. Missing or non-numeric values become NaN.
+    """
+    n = len(metrics_list)
+    columns = {key: np.full(n, np.nan) for _, key in METRIC_FIELDS}
+
+    for i, metrics in enumerate(metrics_list):
+        for section, key in METRIC_FIELDS:
+            val = (metrics.get(section) or {}).get(key)
+            if val is None:
+                continue
+            with suppress(TypeError, ValueError):
+                columns[key][i] = val
+
+    return columns
+
+
+def metrics_frame(metrics_by_ticker: Dict[str, Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Columnar view of many tickers' metrics: one row per ticker, one float64
+    column per numeric field (see METRIC_FIELDS).
+    """
+    tickers = list(metrics_by_ticker)
+    columns = stack_metrics([metrics_by_ticker[t] for t in tickers])
+    return pd.DataFrame(columns, index=pd.Index(tickers, name="Ticker"))
+
+
+def _info_column(
+    info_df: pd.DataFrame, names: Tuple[str, ...], skip_zero: bool = False
+) -> np.ndarray:
+    """
+    First non-NaN value across the fallback columns `names`, as float64.
+
+    With skip_zero, zeros count as missing too, matching the truthiness
+    checks compute_metrics applies (e.g. _coalesce, `if free_cash_flow`).
+    """
+    out = np.full(len(info_df), np.nan)
+    for name in names:
+        if name in info_df.columns:
+            vals = pd.to_numeric(info_df[name], errors="coerce").to_numpy(
+                dtype=np.float64
+            )
+            if skip_zero:
+                vals = np.where(vals == 0, np.nan, vals)
+            out = np.where(np.isnan(out), vals, out)
+    return out
+
+
+def compute_multiples_frame(info_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Vectorized version of the derived multiples in compute_metrics.
+
+    `info_df` has one row per ticker and yfinance .info keys as columns
+    (e.g. pd.DataFrame.from_dict(infos, orient="index")). Returns ev_ebitda,
+    ev_sales, fcf_yield and fcf_conversion on the same index, matching
+    compute_metrics row by row with two caveats: a missing key and an
+    explicit NaN look the same in a frame, and with no price history the
+    market-cap fallback can only use currentPrice.
+    """
+    enterprise_value = _info_column(info_df, ("enterpriseValue",))
+    # compute_metrics skips a zero FCF or net income (they're falsy)
+    free_cash_flow = _info_column(info_df, ("freeCashflow",), skip_zero=True)
+    net_income = _info_column(info_df, _NET_INCOME_KEYS, skip_zero=True)
+    ebitda = _info_column(info_df, ("ebitda",))
+    total_revenue = _info_column(info_df, ("totalRevenue",))
+
+    # Same market-cap fallback as compute_metrics: price * shares outstanding
+    market_cap = _info_column(info_df, ("marketCap",))
+    price = _info_column(info_df, ("currentPrice",))
+    shares_out = _info_column(info_df, ("sharesOutstanding",), skip_zero=True)
+    market_cap = np.where(np.isnan(market_cap), price * shares_out, market_cap)
+
+    return pd.DataFrame(
+        {
+            "ev_ebitda": _safe_div_vec(enterprise_value, ebitda),
+            "ev_sales": _safe_div_vec(enterprise_value, total_revenue),
+            "fcf_yield": _safe_div_vec(free_cash_flow, market_cap),
+            "fcf_conversion": _safe_div_vec(free_cash_flow, net_income),
+        },
+        index=info_df.index,
+    )
@@ -1,6 +1,10 @@
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, List
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 import math
+import sys
 
 import numpy as np
 
@@ -13,42 +17,55 @@ class InvestorProfile:
     category: str
     description: str
     rules_fn: Callable[[Dict[str, Any]], Dict[str, Any]]  # returns summary & rules
+    # Built-in profiles also expose their rule table so several profiles can
+    # be evaluated off one metrics pass (see evaluate_all). Empty for custom
+    # profiles, which are only reachable through rules_fn.
+    rules: Tuple["RuleSpec", ...] = ()
+    summary_label: str = ""
 
 
-# ---------- helpers ----------
+# Rule statuses as they appear in rule dicts; app.py keys its icons on them.
+PASS = sys.intern("pass")
+WARN = sys.intern("warn")
+FAIL = sys.intern("fail")
+NA = sys.intern("na")
 
+# Evaluation works on integer codes (index into _STATUS_NAMES) and only
+# renders the strings above when building the rule dicts.
+_PASS, _WARN, _FAIL, _NA = range(4)
+_STATUS_NAMES = (PASS, WARN, FAIL, NA)
+_STATUS_CODES = {name: code for code, name in enumerate(_STATUS_NAMES)}
 
-def _get(metrics: Dict[str, Any], section: str, key: str) -> float:
-    val = metrics.get(section, {}).get(key, float("nan"))
-    try:
-        return float(val)
-    except Exception:
-        return float("nan")
+
+# ---------- helpers ----------
 
 
 def _is_nan(x: Any) -> bool:
-    try:
-        return x is None or (isinstance(x, float) and math.isnan(x))
-    except Exception:
-        return False
+    # NaN is the only value that isn't equal to itself
+    return x is None or x != x
+
+
+# Formatting the "," separator costs extra; below these magnitudes the
+# rounded value can't reach four digits, so the plain format is identical.
+_PCT_NO_GROUPING = 999.9
+_NUM_NO_GROUPING = 999.99
 
 
 def _fmt_pct(x: Any) -> str:
-    try:
-        if _is_nan(x):
-            return "—"
-        return f"{float(x) * 100:,.1f}%"
-    except Exception:
+    if x is None or x != x:
         return "—"
+    pct = x * 100
+    if -_PCT_NO_GROUPING < pct < _PCT_NO_GROUPING:
+        return f"{pct:.1f}%"
+    return f"{pct:,.1f}%"
 
 
 def _fmt_num(x: Any) -> str:
-    try:
-        if _is_nan(x):
-            return "—"
-        return f"{float(x):,.2f}"
-    except Exception:
+    if x is None or x != x:
         return "—"
+    if -_NUM_NO_GROUPING < x < _NUM_NO_GROUPING:
+        return f"{x:.2f}"
+    return f"{x:,.2f}"
 
 
 def _rule(
@@ -68,18 +85,29 @@ def _rule(
     }
 
 
-def _summary_from_rules(rules: List[Dict[str, Any]], label: str) -> Dict[str, Any]:
-    passes = sum(1 for r in rules if r["status"] == "pass")
-    warns = sum(1 for r in rules if r["status"] == "warn")
-    fails = sum(1 for r in rules if r["status"] == "fail")
+@lru_cache(maxsize=None)
+def _headlines(label: str) -> Tuple[str, str, str]:
+    """The three possible summary headlines for a profile label."""
+    return (
+        f"Very {label}-friendly profile.",
+        f"Mixed but somewhat {label}-compatible.",
+        f"Not a classic {label}-style candidate.",
+    )
 
-    headline = ""
+
+def _summary_from_codes(codes: Sequence[int], label: str) -> Dict[str, Any]:
+    counts = [0, 0, 0, 0]
+    for code in codes:
+        counts[code] += 1
+    passes, warns, fails = counts[_PASS], counts[_WARN], counts[_FAIL]
+
+    friendly, mixed, unlikely = _headlines(label)
     if fails == 0 and passes >= 4:
-        headline = f"Very {label}-friendly profile."
+        headline = friendly
     elif passes >= fails:
-        headline = f"Mixed but somewhat {label}-compatible."
+        headline = mixed
     else:
-        headline = f"Not a classic {label}-style candidate."
+        headline = unlikely
 
     return {
         "passes": passes,
@@ -89,1133 +117,771 @@ def _summary_from_rules(rules: List[Dict[str, Any]], label: str) -> Dict[str, An
     }
 
 
-# ---------- Graham (Deep Value) ----------
-
-
-def graham_rules(metrics: Dict[str, Any]) -> Dict[str, Any]:
-    pe = _get(metrics, "valuation", "pe")
-    pb = _get(metrics, "valuation", "pb")
-    debt_to_equity = _get(metrics, "balance_sheet", "debt_to_equity")
-    current_ratio = _get(metrics, "balance_sheet", "current_ratio")
-
-    rules: List[Dict[str, Any]] = []
-
-    # Rule 1: P/E ≤ 15
-    if _is_nan(pe):
-        rules.append(
-            _rule(
-                "P/E multiple",
-                "P/E ≤ 15",
-                pe,
-                "na",
-                "P/E not available from Yahoo Finance.",
-            )
-        )
-    else:
-        status = "pass" if pe <= 15 else "fail"
-        comment = (
-            "Classic Graham low multiple."
-            if status == "pass"
-            else "Above the classic Graham threshold."
-        )
-        rules.append(_rule("P/E multiple", "P/E ≤ 15", pe, status, comment))
-
-    # Rule 2: P/B ≤ 1.5
-    if _is_nan(pb):
-        rules.append(
-            _rule(
-                "Price to book",
-                "P/B ≤ 1.5",
-                pb,
-                "na",
-                "Book value data missing.",
-            )
-        )
-    else:
-        status = "pass" if pb <= 1.5 else "fail"
-        comment = (
-            "Discount or near-discount to book."
-            if status == "pass"
-            else "Above classic Graham P/B."
-        )
-        rules.append(_rule("Price to book", "P/B ≤ 1.5", pb, status, comment))
-
-    # Rule 3: P/E × P/B ≤ 22.5 (famous Graham product)
-    if _is_nan(pe) or _is_nan(pb):
-        rules.append(
-            _rule(
-                "Graham product",
-                "P/E × P/B ≤ 22.5",
-                float("nan"),
-                "na",
-                "Need both P/E and P/B to check this.",
-            )
-        )
-    else:
-        prod = pe * pb
-        status = "pass" if prod <= 22.5 else "fail"
-        comment = (
-            "Within Graham's classic combined limit."
-            if status == "pass"
-            else "Above Graham's combined P/E×P/B limit."
-        )
-        rules.append(
-            _rule(
-                "Graham product",
-                "P/E × P/B ≤ 22.5",
-                prod,
-                status,
-            )
-        )
+# ---------- rule tables ----------
 
-    # Rule 4: Debt/Equity ≤ 0.5 (≤1.0 as warning)
-    if _is_nan(debt_to_equity):
-        rules.append(
-            _rule(
-                "Leverage",
-                "Debt/Equity ≤ 0.5",
-                debt_to_equity,
-                "na",
-                "Leverage data missing.",
-            )
-        )
-    else:
-        if debt_to_equity <= 0.5:
-            status, comment = "pass", "Very conservative leverage."
-        elif debt_to_equity <= 1.0:
-            status, comment = "warn", "Moderate leverage."
-        else:
-            status, comment = "fail", "High leverage for Graham style."
-        rules.append(
-            _rule(
-                "Leverage",
-                "Debt/Equity ≤ 0.5",
-                debt_to_equity,
-                status,
-                comment,
-            )
-        )
 
-    # Rule 5: Current ratio ≥ 2 (≥1.5 warning)
-    if _is_nan(current_ratio):
-        rules.append(
-            _rule(
-                "Liquidity",
-                "Current ratio ≥ 2.0",
-                current_ratio,
-                "na",
-                "Liquidity data missing.",
-            )
-        )
-    else:
-        if current_ratio >= 2.0:
-            status, comment = "pass", "Strong near-term liquidity."
-        elif current_ratio >= 1.5:
-            status, comment = "warn", "Acceptable but not ideal."
-        else:
-            status, comment = "fail", "Weak current ratio for Graham."
-        rules.append(
-            _rule(
-                "Liquidity",
-                "Current ratio ≥ 2.0",
-                current_ratio,
-                status,
-                comment,
-            )
-        )
+def _above(x: float) -> float:
+    """Smallest float above x: as a cut point, x itself stays in the lower band."""
+    return math.nextafter(x, math.inf)
 
-    summary = _summary_from_rules(rules, "Graham")
-    return {"summary": summary, "rules": rules}
 
+@dataclass(frozen=True, eq=False)
+class RuleSpec:
+    """
+    One checklist rule as data: a metric bucketed by ascending cut points.
 
-# ---------- Buffett (Quality at a Fair Price) ----------
+    outcomes[i] is the (status, comment) for band i, so there is one more
+    outcome than thresholds. side follows np.searchsorted: "left" keeps a
+    value equal to a cut point in the lower band (≤ rules), "right" moves it
+    up (≥ rules). If the metric is missing, fallback is tried next; without
+    one the rule is reported as "na" with na_comment.
+    """
 
+    name: str
+    condition: str
+    metric: Optional[str]
+    thresholds: np.ndarray
+    outcomes: Tuple[Tuple[str, str], ...]
+    na_comment: str = ""
+    as_pct: bool = False
+    side: str = "left"
+    fallback: Optional["RuleSpec"] = None
+    codes: Tuple[int, ...] = field(init=False, repr=False)
+    # Scalar twin of np.searchsorted(thresholds, x, side=side); for a single
+    # value the stdlib bisect avoids NumPy's per-call overhead.
+    cuts: Tuple[float, ...] = field(init=False, repr=False)
+    bisect: Callable[[Sequence[float], float], int] = field(init=False, repr=False)
+    # The "na" result never depends on the metrics, so build it once
+    na_rule: Mapping[str, Any] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "codes", tuple(_STATUS_CODES[s] for s, _ in self.outcomes)
+        )
+        na_rule = _rule(
+            self.name, self.condition, math.nan, NA, self.na_comment, self.as_pct
+        )
+        object.__setattr__(self, "na_rule", MappingProxyType(na_rule))
+        object.__setattr__(
+            self, "thresholds", np.asarray(self.thresholds, dtype=np.float64)
+        )
+        object.__setattr__(self, "cuts", tuple(self.thresholds.tolist()))
+        object.__setattr__(
+            self, "bisect", bisect_left if self.side == "left" else bisect_right
+        )
+
+
+# Metrics the rule tables read straight from the metrics dict, by section.
+# RuleSpec.metric uses the bare key (keys are unique across sections).
+_METRIC_SECTIONS: Dict[str, Tuple[str, ...]] = {
+    "valuation": ("pe", "pb", "ev_ebitda", "earnings_yield", "fcf_yield", "peg"),
+    "quality": ("roe", "gross_margin", "op_margin", "net_margin", "fcf_conversion"),
+    "growth": ("revenue_growth", "earnings_growth"),
+    "balance_sheet": ("debt_to_equity", "current_ratio"),
+    "dividends": ("dividend_yield", "payout_ratio"),
+}
+
+
+# Shared read-only stand-in for a missing section, so misses don't allocate
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _extract(metrics: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Flatten everything the rule tables read into {metric: float} in one walk
+    over the nested metrics dict. Missing or non-numeric values become NaN.
+    """
+    values: Dict[str, float] = {}
+    for section, keys in _METRIC_SECTIONS.items():
+        sec = metrics.get(section) or _EMPTY
+        for key in keys:
+            val = sec.get(key, math.nan)
+            # compute_metrics already stores floats (np.float64 included), so
+            # only coerce the odd None/int/str
+            if not isinstance(val, float):
+                try:
+                    val = float(val)
+                except Exception:
+                    val = math.nan
+            values[key] = val
+
+    # Derived metrics
+    values["graham_product"] = values["pe"] * values["pb"]  # NaN if either is
+    earn_g = values["earnings_growth"]
+    # Lynch growth: earnings growth, falling back to revenue growth
+    values["lynch_growth"] = values["revenue_growth"] if _is_nan(earn_g) else earn_g
+    return values
+
+
+def _classify(spec: RuleSpec, values: Dict[str, float]) -> Tuple[int, int, RuleSpec]:
+    """
+    (status code, band, spec actually used) for one rule. The spec differs
+    from the one passed in when a fallback was taken; band is -1 for "na".
+    """
+    value = values.get(spec.metric, math.nan)
+    while _is_nan(value) and spec.fallback is not None:
+        spec = spec.fallback
+        value = values.get(spec.metric, math.nan)
+
+    if _is_nan(value):
+        return _NA, -1, spec
+
+    band = spec.bisect(spec.cuts, value)
+    return spec.codes[band], band, spec
+
+
+def _evaluate_rule(
+    spec: RuleSpec, values: Dict[str, float]
+) -> Tuple[int, Mapping[str, Any]]:
+    code, band, spec = _classify(spec, values)
+    if code == _NA:
+        return code, spec.na_rule
+    return code, _rule(
+        spec.name,
+        spec.condition,
+        values[spec.metric],
+        _STATUS_NAMES[code],
+        spec.outcomes[band][1],
+        spec.as_pct,
+    )
+
+
+@lru_cache(maxsize=None)
+def _table_metrics(specs: Tuple[RuleSpec, ...]) -> Tuple[str, ...]:
+    """Every metric name a rule table can read, fallbacks included."""
+    names: Dict[str, None] = {}
+    for spec in specs:
+        while spec is not None:
+            if spec.metric is not None:
+                names[spec.metric] = None
+            spec = spec.fallback
+    return tuple(names)
+
+
+def _cache_key(
+    values: Dict[str, float], specs: Tuple[RuleSpec, ...]
+) -> Tuple[Tuple[str, ...], Tuple[Optional[float], ...]]:
+    # Key the caches on just the floats this table reads. NaN never compares
+    # equal to itself, so it is keyed as None.
+    names = _table_metrics(specs)
+    key = tuple(None if _is_nan(v) else v for v in (values[n] for n in names))
+    return names, key
+
+
+def _unkey(
+    names: Tuple[str, ...], key: Tuple[Optional[float], ...]
+) -> Dict[str, float]:
+    return {n: math.nan if v is None else v for n, v in zip(names, key)}
+
+
+@lru_cache(maxsize=512)
+def _evaluate_cached(
+    specs: Tuple[RuleSpec, ...],
+    label: str,
+    names: Tuple[str, ...],
+    key: Tuple[Optional[float], ...],
+) -> Tuple[Dict[str, Any], Tuple[Mapping[str, Any], ...]]:
+    values = _unkey(names, key)
+    codes, rules = zip(*(_evaluate_rule(spec, values) for spec in specs))
+    return _summary_from_codes(codes, label), rules
+
+
+@lru_cache(maxsize=4096)
+def _summary_cached(
+    specs: Tuple[RuleSpec, ...],
+    label: str,
+    names: Tuple[str, ...],
+    key: Tuple[Optional[float], ...],
+) -> Dict[str, Any]:
+    # Same counts as _evaluate_cached, minus building and formatting rule dicts
+    values = _unkey(names, key)
+    codes = [_classify(spec, values)[0] for spec in specs]
+    return _summary_from_codes(codes, label)
 
-def buffett_rules(metrics: Dict[str, Any]) -> Dict[str, Any]:
-    roe = _get(metrics, "quality", "roe")
-    gross_margin = _get(metrics, "quality", "gross_margin")
-    op_margin = _get(metrics, "quality", "op_margin")
-    fcf_conv = _get(metrics, "quality", "fcf_conversion")
-    debt_to_equity = _get(metrics, "balance_sheet", "debt_to_equity")
-    pe = _get(metrics, "valuation", "pe")
-
-    rules: List[Dict[str, Any]] = []
-
-    # ROE ≥ 15%
-    if _is_nan(roe):
-        rules.append(
-            _rule(
-                "Return on equity",
-                "ROE ≥ 15%",
-                roe,
-                "na",
-                "ROE not available.",
-                as_pct=True,
-            )
-        )
-    else:
-        if roe >= 0.20:
-            status, comment = "pass", "Excellent long-term profitability."
-        elif roe >= 0.15:
-            status, comment = "pass", "Good profitability."
-        elif roe >= 0.10:
-            status, comment = "warn", "Okay, but not standout."
-        else:
-            status, comment = "fail", "Low ROE for a Buffett compounder."
-        rules.append(
-            _rule(
-                "Return on equity",
-                "ROE ≥ 15%",
-                roe,
-                status,
-                comment,
-                as_pct=True,
-            )
-        )
 
-    # Gross margin ≥ 40%
-    if _is_nan(gross_margin):
-        rules.append(
-            _rule(
-                "Gross margin",
-                "Gross margin ≥ 40%",
-                gross_margin,
-                "na",
-                "Margin data missing.",
-                as_pct=True,
-            )
-        )
-    else:
-        status = "pass" if gross_margin >= 0.4 else "warn"
-        comment = (
-            "Indicates pricing power and moat."
-            if status == "pass"
-            else "Not obviously a high-moat margin."
-        )
-        rules.append(
-            _rule(
-                "Gross margin",
-                "Gross margin ≥ 40%",
-                gross_margin,
-                status,
-                comment,
-                as_pct=True,
-            )
-        )
+def _evaluate_values(
+    values: Dict[str, float],
+    specs: Tuple[RuleSpec, ...],
+    label: str,
+    want_rules: bool = True,
+) -> Dict[str, Any]:
+    names, key = _cache_key(values, specs)
+    if not want_rules:
+        return {"summary": dict(_summary_cached(specs, label, names, key))}
+    summary, rules = _evaluate_cached(specs, label, names, key)
+    # Hand out copies so callers can't mutate the cached result
+    return {"summary": dict(summary), "rules": [dict(r) for r in rules]}
 
-    # Operating margin ≥ 20%
-    if _is_nan(op_margin):
-        rules.append(
-            _rule(
-                "Operating margin",
-                "Operating margin ≥ 20%",
-                op_margin,
-                "na",
-                "Operating margin missing.",
-                as_pct=True,
-            )
-        )
-    else:
-        if op_margin >= 0.20:
-            status, comment = "pass", "Strong operating profitability."
-        elif op_margin >= 0.12:
-            status, comment = "warn", "Decent but not elite."
-        else:
-            status, comment = "fail", "Thin operating margin."
-        rules.append(
-            _rule(
-                "Operating margin",
-                "Operating margin ≥ 20%",
-                op_margin,
-                status,
-                comment,
-                as_pct=True,
-            )
-        )
 
-    # FCF / Net income between 80% and 120%
-    if _is_nan(fcf_conv):
-        rules.append(
-            _rule(
-                "Cash conversion",
-                "FCF / Net income ≈ 80–120%",
-                fcf_conv,
-                "na",
-                "Cash-flow detail missing.",
-                as_pct=True,
-            )
-        )
-    else:
-        if 0.8 <= fcf_conv <= 1.2:
-            status, comment = "pass", "Earnings are backed by cash."
-        elif 0.6 <= fcf_conv <= 1.4:
-            status, comment = "warn", "Okay but a bit noisy."
-        else:
-            status, comment = "fail", "Earnings not reliably backed by cash."
-        rules.append(
-            _rule(
-                "Cash conversion",
-                "FCF / Net income ≈ 80–120%",
-                fcf_conv,
-                status,
-                comment,
-                as_pct=True,
-            )
-        )
+def _evaluate(
+    metrics: Dict[str, Any], specs: Tuple[RuleSpec, ...], label: str
+) -> Dict[str, Any]:
+    return _evaluate_values(_extract(metrics), specs, label)
 
-    # Debt/Equity ≤ 0.5 (≤1.0 warning)
-    if _is_nan(debt_to_equity):
-        rules.append(
-            _rule(
-                "Leverage",
-                "Debt/Equity ≤ 0.5",
-                debt_to_equity,
-                "na",
-                "Leverage data missing.",
-            )
-        )
-    else:
-        if debt_to_equity <= 0.5:
-            status, comment = "pass", "Very conservative balance sheet."
-        elif debt_to_equity <= 1.0:
-            status, comment = "warn", "Moderate leverage."
-        else:
-            status, comment = "fail", "Heavy leverage for Buffett style."
-        rules.append(
-            _rule("Leverage", "Debt/Equity ≤ 0.5", debt_to_equity, status, comment)
-        )
 
-    # P/E ≤ 20 (≤30 warning)
-    if _is_nan(pe):
-        rules.append(
-            _rule(
-                "Valuation",
-                "P/E ≤ 20",
-                pe,
-                "na",
-                "P/E not available.",
-            )
-        )
-    else:
-        if pe <= 20:
-            status, comment = "pass", "Reasonable price for quality."
-        elif pe <= 30:
-            status, comment = "warn", "Somewhat rich valuation."
-        else:
-            status, comment = "fail", "Very expensive relative to earnings."
-        rules.append(_rule("Valuation", "P/E ≤ 20", pe, status, comment))
+def _leverage_spec(condition: str, low: str, moderate: str, high: str) -> RuleSpec:
+    """
+    The Debt/Equity rule every profile shares: pass up to 0.5, warn up to
+    1.0, fail above. Only the condition text and comments vary by profile.
+    """
+    return RuleSpec(
+        name="Leverage",
+        condition=condition,
+        metric="debt_to_equity",
+        thresholds=(0.5, 1.0),
+        outcomes=((PASS, low), (WARN, moderate), (FAIL, high)),
+        na_comment="Leverage data missing.",
+    )
 
-    summary = _summary_from_rules(rules, "Buffett")
-    return {"summary": summary, "rules": rules}
 
+# ---------- Graham (Deep Value) ----------
 
-# ---------- Lynch (GARP / PEG) ----------
+_GRAHAM_RULES: Tuple[RuleSpec, ...] = (
+    RuleSpec(
+        name="P/E multiple",
+        condition="P/E ≤ 15",
+        metric="pe",
+        thresholds=(15.0,),
+        outcomes=(
+            (PASS, "Classic Graham low multiple."),
+            (FAIL, "Above the classic Graham threshold."),
+        ),
+        na_comment="P/E not available from Yahoo Finance.",
+    ),
+    RuleSpec(
+        name="Price to book",
+        condition="P/B ≤ 1.5",
+        metric="pb",
+        thresholds=(1.5,),
+        outcomes=(
+            (PASS, "Discount or near-discount to book."),
+            (FAIL, "Above classic Graham P/B."),
+        ),
+        na_comment="Book value data missing.",
+    ),
+    # Famous Graham product
+    RuleSpec(
+        name="Graham product",
+        condition="P/E × P/B ≤ 22.5",
+        metric="graham_product",
+        thresholds=(22.5,),
+        outcomes=(
+            (PASS, "Within Graham's classic combined limit."),
+            (FAIL, "Above Graham's combined P/E×P/B limit."),
+        ),
+        na_comment="Need both P/E and P/B to check this.",
+    ),
+    _leverage_spec(
+        "Debt/Equity ≤ 0.5",
+        "Very conservative leverage.",
+        "Moderate leverage.",
+        "High leverage for Graham style.",
+    ),
+    RuleSpec(
+        name="Liquidity",
+        condition="Current ratio ≥ 2.0",
+        metric="current_ratio",
+        thresholds=(1.5, 2.0),
+        outcomes=(
+            (FAIL, "Weak current ratio for Graham."),
+            (WARN, "Acceptable but not ideal."),
+            (PASS, "Strong near-term liquidity."),
+        ),
+        na_comment="Liquidity data missing.",
+        side="right",
+    ),
+)
 
 
-def lynch_rules(metrics: Dict[str, Any]) -> Dict[str, Any]:
-    pe = _get(metrics, "valuation", "pe")
-    peg = _get(metrics, "valuation", "peg")
-    rev_g = _get(metrics, "growth", "revenue_growth")
-    earn_g = _get(metrics, "growth", "earnings_growth")
-    debt_to_equity = _get(metrics, "balance_sheet", "debt_to_equity")
-
-    rules: List[Dict[str, Any]] = []
-
-    growth = earn_g if not _is_nan(earn_g) else rev_g
-
-    # Growth 10–20%+
-    if _is_nan(growth):
-        rules.append(
-            _rule(
-                "Growth rate",
-                "Growth ≥ 10%",
-                growth,
-                "na",
-                "Growth data missing.",
-                as_pct=True,
-            )
-        )
-    else:
-        if growth >= 0.20:
-            status, comment = "pass", "Very strong growth."
-        elif growth >= 0.10:
-            status, comment = "pass", "Solid, Lynch-style grower."
-        elif growth >= 0.05:
-            status, comment = "warn", "Mild growth."
-        else:
-            status, comment = "fail", "Low growth for Lynch-style idea."
-        rules.append(
-            _rule(
-                "Growth rate",
-                "Growth ≥ 10%",
-                growth,
-                status,
-                comment,
-                as_pct=True,
-            )
-        )
+def graham_rules(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    return _evaluate(metrics, _GRAHAM_RULES, "Graham")
 
-    # PEG around 1
-    if _is_nan(peg):
-        rules.append(
-            _rule(
-                "PEG ratio",
-                "PEG ≈ 1.0",
-                peg,
-                "na",
-                "PEG can't be computed reliably.",
-            )
-        )
-    else:
-        if peg <= 1.0:
-            status, comment = "pass", "Classic Lynch PEG ≤ 1."
-        elif peg <= 1.5:
-            status, comment = "warn", "PEG a bit high but maybe okay."
-        else:
-            status, comment = "fail", "PEG too high for GARP."
-        rules.append(_rule("PEG ratio", "PEG ≈ 1.0", peg, status, comment))
-
-    # P/E sanity check (not crazy high)
-    if _is_nan(pe):
-        rules.append(
-            _rule(
-                "P/E guardrail",
-                "P/E not extreme (≤ 30)",
-                pe,
-                "na",
-                "P/E missing.",
-            )
-        )
-    else:
-        if pe <= 20:
-            status, comment = "pass", "Reasonable earnings multiple."
-        elif pe <= 30:
-            status, comment = "warn", "Upper end of reasonable."
-        else:
-            status, comment = "fail", "Too expensive for Lynch-style GARP."
-        rules.append(
-            _rule("P/E guardrail", "P/E not extreme (≤ 30)", pe, status, comment)
-        )
 
-    # Debt/Equity guardrail
-    if _is_nan(debt_to_equity):
-        rules.append(
-            _rule(
-                "Leverage",
-                "Debt/Equity ≤ 1.0",
-                debt_to_equity,
-                "na",
-                "Leverage data missing.",
-            )
-        )
-    else:
-        if debt_to_equity <= 0.5:
-            status, comment = "pass", "Comfortable leverage for a grower."
-        elif debt_to_equity <= 1.0:
-            status, comment = "warn", "Moderate leverage."
-        else:
-            status, comment = "fail", "High leverage for Lynch-style stock."
-        rules.append(
-            _rule("Leverage", "Debt/Equity ≤ 1.0", debt_to_equity, status, comment)
-        )
+# ---------- Buffett (Quality at a Fair Price) ----------
 
-    summary = _summary_from_rules(rules, "Lynch")
-    return {"summary": summary, "rules": rules}
+_BUFFETT_RULES: Tuple[RuleSpec, ...] = (
+    RuleSpec(
+        name="Return on equity",
+        condition="ROE ≥ 15%",
+        metric="roe",
+        thresholds=(0.10, 0.15, 0.20),
+        outcomes=(
+            (FAIL, "Low ROE for a Buffett compounder."),
+            (WARN, "Okay, but not standout."),
+            (PASS, "Good profitability."),
+            (PASS, "Excellent long-term profitability."),
+        ),
+        na_comment="ROE not available.",
+        as_pct=True,
+        side="right",
+    ),
+    RuleSpec(
+        name="Gross margin",
+        condition="Gross margin ≥ 40%",
+        metric="gross_margin",
+        thresholds=(0.40,),
+        outcomes=(
+            (WARN, "Not obviously a high-moat margin."),
+            (PASS, "Indicates pricing power and moat."),
+        ),
+        na_comment="Margin data missing.",
+        as_pct=True,
+        side="right",
+    ),
+    RuleSpec(
+        name="Operating margin",
+        condition="Operating margin ≥ 20%",
+        metric="op_margin",
+        thresholds=(0.12, 0.20),
+        outcomes=(
+            (FAIL, "Thin operating margin."),
+            (WARN, "Decent but not elite."),
+            (PASS, "Strong operating profitability."),
+        ),
+        na_comment="Operating margin missing.",
+        as_pct=True,
+        side="right",
+    ),
+    # Pass inside 80–120%, warn inside 60–140% (both ends inclusive)
+    RuleSpec(
+        name="Cash conversion",
+        condition="FCF / Net income ≈ 80–120%",
+        metric="fcf_conversion",
+        thresholds=(0.6, 0.8, _above(1.2), _above(1.4)),
+        outcomes=(
+            (FAIL, "Earnings not reliably backed by cash."),
+            (WARN, "Okay but a bit noisy."),
+            (PASS, "Earnings are backed by cash."),
+            (WARN, "Okay but a bit noisy."),
+            (FAIL, "Earnings not reliably backed by cash."),
+        ),
+        na_comment="Cash-flow detail missing.",
+        as_pct=True,
+        side="right",
+    ),
+    _leverage_spec(
+        "Debt/Equity ≤ 0.5",
+        "Very conservative balance sheet.",
+        "Moderate leverage.",
+        "Heavy leverage for Buffett style.",
+    ),
+    RuleSpec(
+        name="Valuation",
+        condition="P/E ≤ 20",
+        metric="pe",
+        thresholds=(20.0, 30.0),
+        outcomes=(
+            (PASS, "Reasonable price for quality."),
+            (WARN, "Somewhat rich valuation."),
+            (FAIL, "Very expensive relative to earnings."),
+        ),
+        na_comment="P/E not available.",
+    ),
+)
 
 
-# ---------- Greenblatt (Magic Formula) ----------
+def buffett_rules(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    return _evaluate(metrics, _BUFFETT_RULES, "Buffett")
 
 
-def greenblatt_rules(metrics: Dict[str, Any]) -> Dict[str, Any]:
-    earnings_yield = _get(metrics, "valuation", "earnings_yield")
-    ev_ebitda = _get(metrics, "valuation", "ev_ebitda")
-    roe = _get(metrics, "quality", "roe")
-
-    rules: List[Dict[str, Any]] = []
-
-    # Earnings yield (inverse of P/E)
-    if _is_nan(earnings_yield):
-        rules.append(
-            _rule(
-                "Earnings yield",
-                "Earnings yield ≥ 8%",
-                earnings_yield,
-                "na",
-                "Earnings yield can't be computed.",
-                as_pct=True,
-            )
-        )
-    else:
-        ey = earnings_yield
-        if ey >= 0.15:
-            status, comment = "pass", "Very cheap on earnings."
-        elif ey >= 0.08:
-            status, comment = "pass", "Cheap-ish on earnings."
-        else:
-            status, comment = "fail", "Not cheap for Magic Formula."
-        rules.append(
-            _rule(
-                "Earnings yield",
-                "Earnings yield ≥ 8%",
-                ey,
-                status,
-                comment,
-                as_pct=True,
-            )
-        )
-
-    # Return on equity as ROC proxy
-    if _is_nan(roe):
-        rules.append(
-            _rule(
-                "Return on capital (ROE proxy)",
-                "ROE ≥ 15%",
-                roe,
-                "na",
-                "ROE not available.",
-                as_pct=True,
-            )
-        )
-    else:
-        if roe >= 0.20:
-            status, comment = "pass", "Excellent return on capital."
-        elif roe >= 0.15:
-            status, comment = "pass", "Good return on capital."
-        else:
-            status, comment = "fail", "Weak ROC for Magic Formula."
-        rules.append(
-            _rule(
-                "Return on capital (ROE proxy)",
-                "ROE ≥ 15%",
-                roe,
-                status,
-                comment,
-                as_pct=True,
-            )
-        )
+# ---------- Lynch (GARP / PEG) ----------
 
-    # EV/EBITDA sanity
-    if _is_nan(ev_ebitda):
-        rules.append(
-            _rule(
-                "EV/EBITDA",
-                "EV/EBITDA ≤ 10",
-                ev_ebitda,
-                "na",
-                "EV/EBITDA missing.",
-            )
-        )
-    else:
-        if ev_ebitda <= 8:
-            status, comment = "pass", "Multiple consistent with Magic Formula cheapness."
-        elif ev_ebitda <= 10:
-            status, comment = "warn", "Okay, not screaming cheap."
-        else:
-            status, comment = "fail", "Too expensive on EV/EBITDA."
-        rules.append(
-            _rule("EV/EBITDA", "EV/EBITDA ≤ 10", ev_ebitda, status, comment)
-        )
+_LYNCH_RULES: Tuple[RuleSpec, ...] = (
+    RuleSpec(
+        name="Growth rate",
+        condition="Growth ≥ 10%",
+        metric="lynch_growth",
+        thresholds=(0.05, 0.10, 0.20),
+        outcomes=(
+            (FAIL, "Low growth for Lynch-style idea."),
+            (WARN, "Mild growth."),
+            (PASS, "Solid, Lynch-style grower."),
+            (PASS, "Very strong growth."),
+        ),
+        na_comment="Growth data missing.",
+        as_pct=True,
+        side="right",
+    ),
+    RuleSpec(
+        name="PEG ratio",
+        condition="PEG ≈ 1.0",
+        metric="peg",
+        thresholds=(1.0, 1.5),
+        outcomes=(
+            (PASS, "Classic Lynch PEG ≤ 1."),
+            (WARN, "PEG a bit high but maybe okay."),
+            (FAIL, "PEG too high for GARP."),
+        ),
+        na_comment="PEG can't be computed reliably.",
+    ),
+    RuleSpec(
+        name="P/E guardrail",
+        condition="P/E not extreme (≤ 30)",
+        metric="pe",
+        thresholds=(20.0, 30.0),
+        outcomes=(
+            (PASS, "Reasonable earnings multiple."),
+            (WARN, "Upper end of reasonable."),
+            (FAIL, "Too expensive for Lynch-style GARP."),
+        ),
+        na_comment="P/E missing.",
+    ),
+    _leverage_spec(
+        "Debt/Equity ≤ 1.0",
+        "Comfortable leverage for a grower.",
+        "Moderate leverage.",
+        "High leverage for Lynch-style stock.",
+    ),
+)
 
-    summary = _summary_from_rules(rules, "Greenblatt")
-    return {"summary": summary, "rules": rules}
 
+def lynch_rules(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    return _evaluate(metrics, _LYNCH_RULES, "Lynch")
 
-# ---------- Burry (Deep FCF Value) ----------
 
+# ---------- Greenblatt (Magic Formula) ----------
 
-def burry_rules(metrics: Dict[str, Any]) -> Dict[str, Any]:
-    fcf_yield = _get(metrics, "valuation", "fcf_yield")
-    ev_ebitda = _get(metrics, "valuation", "ev_ebitda")
-    pe = _get(metrics, "valuation", "pe")
-    debt_to_equity = _get(metrics, "balance_sheet", "debt_to_equity")
-
-    rules: List[Dict[str, Any]] = []
-
-    # FCF yield
-    if _is_nan(fcf_yield):
-        rules.append(
-            _rule(
-                "FCF yield",
-                "FCF yield ≥ 8–10%",
-                fcf_yield,
-                "na",
-                "Free cash flow data missing.",
-                as_pct=True,
-            )
-        )
-    else:
-        fy = fcf_yield
-        if fy >= 0.10:
-            status, comment = "pass", "Very cheap on cash flows."
-        elif fy >= 0.06:
-            status, comment = "warn", "Cheap-ish on cash flows."
-        else:
-            status, comment = "fail", "Not cheap on cash flows."
-        rules.append(
-            _rule(
-                "FCF yield",
-                "FCF yield ≥ 8–10%",
-                fy,
-                status,
-                comment,
-                as_pct=True,
-            )
-        )
+_GREENBLATT_RULES: Tuple[RuleSpec, ...] = (
+    RuleSpec(
+        name="Earnings yield",
+        condition="Earnings yield ≥ 8%",
+        metric="earnings_yield",
+        thresholds=(0.08, 0.15),
+        outcomes=(
+            (FAIL, "Not cheap for Magic Formula."),
+            (PASS, "Cheap-ish on earnings."),
+            (PASS, "Very cheap on earnings."),
+        ),
+        na_comment="Earnings yield can't be computed.",
+        as_pct=True,
+        side="right",
+    ),
+    RuleSpec(
+        name="Return on capital (ROE proxy)",
+        condition="ROE ≥ 15%",
+        metric="roe",
+        thresholds=(0.15, 0.20),
+        outcomes=(
+            (FAIL, "Weak ROC for Magic Formula."),
+            (PASS, "Good return on capital."),
+            (PASS, "Excellent return on capital."),
+        ),
+        na_comment="ROE not available.",
+        as_pct=True,
+        side="right",
+    ),
+    RuleSpec(
+        name="EV/EBITDA",
+        condition="EV/EBITDA ≤ 10",
+        metric="ev_ebitda",
+        thresholds=(8.0, 10.0),
+        outcomes=(
+            (PASS, "Multiple consistent with Magic Formula cheapness."),
+            (WARN, "Okay, not screaming cheap."),
+            (FAIL, "Too expensive on EV/EBITDA."),
+        ),
+        na_comment="EV/EBITDA missing.",
+    ),
+)
 
-    # EV/EBITDA or P/E as backup
-    if _is_nan(ev_ebitda) and _is_nan(pe):
-        rules.append(
-            _rule(
-                "Valuation multiples",
-                "EV/EBITDA ≤ 10 or P/E ≤ 12",
-                float("nan"),
-                "na",
-                "Valuation multiples missing.",
-            )
-        )
-    else:
-        if not _is_nan(ev_ebitda):
-            if ev_ebitda <= 8:
-                status, comment = "pass", "EV/EBITDA consistent with deep value."
-            elif ev_ebitda <= 10:
-                status, comment = "warn", "Okay but not extreme value."
-            else:
-                status, comment = "fail", "Rich on EV/EBITDA for Burry."
-            rules.append(
-                _rule(
-                    "EV/EBITDA",
-                    "EV/EBITDA ≤ 10",
-                    ev_ebitda,
-                    status,
-                    comment,
-                )
-            )
-        else:
-            if pe <= 10:
-                status, comment = "pass", "Low P/E as backup value signal."
-            elif pe <= 14:
-                status, comment = "warn", "Moderate P/E."
-            else:
-                status, comment = "fail", "High P/E for deep value."
-            rules.append(_rule("P/E", "P/E ≤ 12", pe, status, comment))
-
-    # Leverage
-    if _is_nan(debt_to_equity):
-        rules.append(
-            _rule(
-                "Leverage",
-                "Debt/Equity ≤ 1.0",
-                debt_to_equity,
-                "na",
-                "Leverage data missing.",
-            )
-        )
-    else:
-        if debt_to_equity <= 0.5:
-            status, comment = "pass", "Very conservative balance sheet."
-        elif debt_to_equity <= 1.0:
-            status, comment = "warn", "Manageable leverage."
-        else:
-            status, comment = "fail", "High leverage for a deep value idea."
-        rules.append(
-            _rule("Leverage", "Debt/Equity ≤ 1.0", debt_to_equity, status, comment)
-        )
 
-    summary = _summary_from_rules(rules, "Burry")
-    return {"summary": summary, "rules": rules}
+def greenblatt_rules(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    return _evaluate(metrics, _GREENBLATT_RULES, "Greenblatt")
 
 
-# ---------- Terry Smith (Quality Compounders) ----------
+# ---------- Burry (Deep FCF Value) ----------
 
+_BURRY_RULES: Tuple[RuleSpec, ...] = (
+    RuleSpec(
+        name="FCF yield",
+        condition="FCF yield ≥ 8–10%",
+        metric="fcf_yield",
+        thresholds=(0.06, 0.10),
+        outcomes=(
+            (FAIL, "Not cheap on cash flows."),
+            (WARN, "Cheap-ish on cash flows."),
+            (PASS, "Very cheap on cash flows."),
+        ),
+        na_comment="Free cash flow data missing.",
+        as_pct=True,
+        side="right",
+    ),
+    # EV/EBITDA, with P/E as backup when EV/EBITDA is missing
+    RuleSpec(
+        name="EV/EBITDA",
+        condition="EV/EBITDA ≤ 10",
+        metric="ev_ebitda",
+        thresholds=(8.0, 10.0),
+        outcomes=(
+            (PASS, "EV/EBITDA consistent with deep value."),
+            (WARN, "Okay but not extreme value."),
+            (FAIL, "Rich on EV/EBITDA for Burry."),
+        ),
+        fallback=RuleSpec(
+            name="P/E",
+            condition="P/E ≤ 12",
+            metric="pe",
+            thresholds=(10.0, 14.0),
+            outcomes=(
+                (PASS, "Low P/E as backup value signal."),
+                (WARN, "Moderate P/E."),
+                (FAIL, "High P/E for deep value."),
+            ),
+            fallback=RuleSpec(
+                name="Valuation multiples",
+                condition="EV/EBITDA ≤ 10 or P/E ≤ 12",
+                metric=None,
+                thresholds=(),
+                outcomes=(),
+                na_comment="Valuation multiples missing.",
+            ),
+        ),
+    ),
+    _leverage_spec(
+        "Debt/Equity ≤ 1.0",
+        "Very conservative balance sheet.",
+        "Manageable leverage.",
+        "High leverage for a deep value idea.",
+    ),
+)
 
-def smith_rules(metrics: Dict[str, Any]) -> Dict[str, Any]:
-    roe = _get(metrics, "quality", "roe")
-    gross_margin = _get(metrics, "quality", "gross_margin")
-    net_margin = _get(metrics, "quality", "net_margin")
-    rev_g = _get(metrics, "growth", "revenue_growth")
-    debt_to_equity = _get(metrics, "balance_sheet", "debt_to_equity")
-    pe = _get(metrics, "valuation", "pe")
-
-    rules: List[Dict[str, Any]] = []
-
-    # ROE ≥ 15%
-    if _is_nan(roe):
-        rules.append(
-            _rule(
-                "ROE",
-                "ROE ≥ 15%",
-                roe,
-                "na",
-                "ROE not available.",
-                as_pct=True,
-            )
-        )
-    else:
-        if roe >= 0.20:
-            status, comment = "pass", "Very strong returns on capital."
-        elif roe >= 0.15:
-            status, comment = "pass", "Good returns on capital."
-        elif roe >= 0.10:
-            status, comment = "warn", "Okay but not elite."
-        else:
-            status, comment = "fail", "Weak ROE for Smith-style compounders."
-        rules.append(
-            _rule("ROE", "ROE ≥ 15%", roe, status, comment, as_pct=True)
-        )
 
-    # Gross margin ≥ 50%
-    if _is_nan(gross_margin):
-        rules.append(
-            _rule(
-                "Gross margin",
-                "Gross margin ≥ 50%",
-                gross_margin,
-                "na",
-                "Margin data missing.",
-                as_pct=True,
-            )
-        )
-    else:
-        if gross_margin >= 0.50:
-            status, comment = "pass", "High value-add / pricing power."
-        elif gross_margin >= 0.40:
-            status, comment = "warn", "Okay but not top-tier."
-        else:
-            status, comment = "fail", "Low gross margin for Smith-style quality."
-        rules.append(
-            _rule(
-                "Gross margin",
-                "Gross margin ≥ 50%",
-                gross_margin,
-                status,
-                comment,
-                as_pct=True,
-            )
-        )
+def burry_rules(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    return _evaluate(metrics, _BURRY_RULES, "Burry")
 
-    # Net margin ≥ 10%
-    if _is_nan(net_margin):
-        rules.append(
-            _rule(
-                "Net margin",
-                "Net margin ≥ 10%",
-                net_margin,
-                "na",
-                "Net margin missing.",
-                as_pct=True,
-            )
-        )
-    else:
-        if net_margin >= 0.15:
-            status, comment = "pass", "Very strong net margins."
-        elif net_margin >= 0.10:
-            status, comment = "pass", "Healthy net margins."
-        elif net_margin >= 0.07:
-            status, comment = "warn", "Okay margins."
-        else:
-            status, comment = "fail", "Thin profitability."
-        rules.append(
-            _rule(
-                "Net margin",
-                "Net margin ≥ 10%",
-                net_margin,
-                status,
-                comment,
-                as_pct=True,
-            )
-        )
 
-    # Revenue growth ≥ 5%
-    if _is_nan(rev_g):
-        rules.append(
-            _rule(
-                "Revenue growth",
-                "Growth ≥ 5%",
-                rev_g,
-                "na",
-                "Growth data missing.",
-                as_pct=True,
-            )
-        )
-    else:
-        if rev_g >= 0.10:
-            status, comment = "pass", "Solid top-line growth."
-        elif rev_g >= 0.05:
-            status, comment = "pass", "Reasonable growth."
-        elif rev_g >= 0.0:
-            status, comment = "warn", "Flat-ish revenue."
-        else:
-            status, comment = "fail", "Shrinking business."
-        rules.append(
-            _rule(
-                "Revenue growth",
-                "Growth ≥ 5%",
-                rev_g,
-                status,
-                comment,
-                as_pct=True,
-            )
-        )
+# ---------- Terry Smith (Quality Compounders) ----------
 
-    # Debt/Equity ≤ 0.5 (≤1.0 warning)
-    if _is_nan(debt_to_equity):
-        rules.append(
-            _rule(
-                "Leverage",
-                "Debt/Equity ≤ 0.5",
-                debt_to_equity,
-                "na",
-                "Leverage data missing.",
-            )
-        )
-    else:
-        if debt_to_equity <= 0.5:
-            status, comment = "pass", "Balance sheet fits quality style."
-        elif debt_to_equity <= 1.0:
-            status, comment = "warn", "Some leverage but manageable."
-        else:
-            status, comment = "fail", "Too much leverage for Smith style."
-        rules.append(
-            _rule("Leverage", "Debt/Equity ≤ 0.5", debt_to_equity, status, comment)
-        )
+_SMITH_RULES: Tuple[RuleSpec, ...] = (
+    RuleSpec(
+        name="ROE",
+        condition="ROE ≥ 15%",
+        metric="roe",
+        thresholds=(0.10, 0.15, 0.20),
+        outcomes=(
+            (FAIL, "Weak ROE for Smith-style compounders."),
+            (WARN, "Okay but not elite."),
+            (PASS, "Good returns on capital."),
+            (PASS, "Very strong returns on capital."),
+        ),
+        na_comment="ROE not available.",
+        as_pct=True,
+        side="right",
+    ),
+    RuleSpec(
+        name="Gross margin",
+        condition="Gross margin ≥ 50%",
+        metric="gross_margin",
+        thresholds=(0.40, 0.50),
+        outcomes=(
+            (FAIL, "Low gross margin for Smith-style quality."),
+            (WARN, "Okay but not top-tier."),
+            (PASS, "High value-add / pricing power."),
+        ),
+        na_comment="Margin data missing.",
+        as_pct=True,
+        side="right",
+    ),
+    RuleSpec(
+        name="Net margin",
+        condition="Net margin ≥ 10%",
+        metric="net_margin",
+        thresholds=(0.07, 0.10, 0.15),
+        outcomes=(
+            (FAIL, "Thin profitability."),
+            (WARN, "Okay margins."),
+            (PASS, "Healthy net margins."),
+            (PASS, "Very strong net margins."),
+        ),
+        na_comment="Net margin missing.",
+        as_pct=True,
+        side="right",
+    ),
+    RuleSpec(
+        name="Revenue growth",
+        condition="Growth ≥ 5%",
+        metric="revenue_growth",
+        thresholds=(0.0, 0.05, 0.10),
+        outcomes=(
+            (FAIL, "Shrinking business."),
+            (WARN, "Flat-ish revenue."),
+            (PASS, "Reasonable growth."),
+            (PASS, "Solid top-line growth."),
+        ),
+        na_comment="Growth data missing.",
+        as_pct=True,
+        side="right",
+    ),
+    _leverage_spec(
+        "Debt/Equity ≤ 0.5",
+        "Balance sheet fits quality style.",
+        "Some leverage but manageable.",
+        "Too much leverage for Smith style.",
+    ),
+    RuleSpec(
+        name="Valuation",
+        condition="P/E ≤ 30–35",
+        metric="pe",
+        thresholds=(25.0, 35.0),
+        outcomes=(
+            (PASS, "Valuation broadly reasonable for quality."),
+            (WARN, "Stretch valuation."),
+            (FAIL, "Very rich for Smith style."),
+        ),
+        na_comment="P/E not available.",
+    ),
+)
 
-    # P/E guardrail: ≤ 30
-    if _is_nan(pe):
-        rules.append(
-            _rule(
-                "Valuation",
-                "P/E ≤ 30",
-                pe,
-                "na",
-                "P/E not available.",
-            )
-        )
-    else:
-        if pe <= 25:
-            status, comment = "pass", "Valuation broadly reasonable for quality."
-        elif pe <= 35:
-            status, comment = "warn", "Stretch valuation."
-        else:
-            status, comment = "fail", "Very rich for Smith style."
-        rules.append(_rule("Valuation", "P/E ≤ 30–35", pe, status, comment))
 
-    summary = _summary_from_rules(rules, "Smith-style quality")
-    return {"summary": summary, "rules": rules}
+def smith_rules(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    return _evaluate(metrics, _SMITH_RULES, "Smith-style quality")
 
 
 # ---------- Dividend Investor (Income Quality) ----------
 
+_DIVIDEND_RULES: Tuple[RuleSpec, ...] = (
+    # Pass inside 2–8% (both ends inclusive), warn either side
+    RuleSpec(
+        name="Dividend yield",
+        condition="Target 2–8%",
+        metric="dividend_yield",
+        thresholds=(0.02, _above(0.08)),
+        outcomes=(
+            (WARN, "Low current yield."),
+            (PASS, "Comfortable income range."),
+            (WARN, "Very high yield – check sustainability."),
+        ),
+        na_comment="Dividend yield not available.",
+        as_pct=True,
+        side="right",
+    ),
+    RuleSpec(
+        name="Payout ratio",
+        condition="Payout ≤ 70%",
+        metric="payout_ratio",
+        thresholds=(0.5, 0.7),
+        outcomes=(
+            (PASS, "Comfortable payout with room to reinvest."),
+            (WARN, "Upper end of comfortable."),
+            (FAIL, "Very high payout ratio."),
+        ),
+        na_comment="Payout ratio not reported.",
+        as_pct=True,
+    ),
+    RuleSpec(
+        name="FCF yield",
+        condition="FCF yield ≥ 0%",
+        metric="fcf_yield",
+        thresholds=(0.0, 0.05),
+        outcomes=(
+            (FAIL, "Negative free cash flow."),
+            (WARN, "Thin cash backing."),
+            (PASS, "Strong cash backing for dividends."),
+        ),
+        na_comment="Free cash flow data missing.",
+        as_pct=True,
+        side="right",
+    ),
+    _leverage_spec(
+        "Debt/Equity ≤ 1.0",
+        "Conservative balance sheet.",
+        "Moderate leverage.",
+        "High leverage for dividend safety.",
+    ),
+    RuleSpec(
+        name="Earnings growth",
+        condition="Growth ≥ 0%",
+        metric="earnings_growth",
+        thresholds=(0.0, 0.05),
+        outcomes=(
+            (FAIL, "Shrinking earnings – risk to dividend."),
+            (WARN, "Flat earnings – watch closely."),
+            (PASS, "Growing earnings support dividend growth."),
+        ),
+        na_comment="Earnings growth missing.",
+        as_pct=True,
+        side="right",
+    ),
+)
 
-def dividend_rules(metrics: Dict[str, Any]) -> Dict[str, Any]:
-    div_yield = _get(metrics, "dividends", "dividend_yield")
-    payout = _get(metrics, "dividends", "payout_ratio")
-    fcf_yield = _get(metrics, "valuation", "fcf_yield")
-    debt_to_equity = _get(metrics, "balance_sheet", "debt_to_equity")
-    earnings_growth = _get(metrics, "growth", "earnings_growth")
-
-    rules: List[Dict[str, Any]] = []
-
-    # Dividend yield between ~2% and 8%
-    if _is_nan(div_yield):
-        rules.append(
-            _rule(
-                "Dividend yield",
-                "Target 2–8%",
-                div_yield,
-                "na",
-                "Dividend yield not available.",
-                as_pct=True,
-            )
-        )
-    else:
-        if 0.02 <= div_yield <= 0.08:
-            status, comment = "pass", "Comfortable income range."
-        elif div_yield < 0.02:
-            status, comment = "warn", "Low current yield."
-        else:
-            status, comment = "warn", "Very high yield – check sustainability."
-        rules.append(
-            _rule(
-                "Dividend yield",
-                "Target 2–8%",
-                div_yield,
-                status,
-                comment,
-                as_pct=True,
-            )
-        )
-
-    # Payout ratio < 70%
-    if _is_nan(payout):
-        rules.append(
-            _rule(
-                "Payout ratio",
-                "Payout ≤ 70%",
-                payout,
-                "na",
-                "Payout ratio not reported.",
-                as_pct=True,
-            )
-        )
-    else:
-        if payout <= 0.5:
-            status, comment = "pass", "Comfortable payout with room to reinvest."
-        elif payout <= 0.7:
-            status, comment = "warn", "Upper end of comfortable."
-        else:
-            status, comment = "fail", "Very high payout ratio."
-        rules.append(
-            _rule(
-                "Payout ratio",
-                "Payout ≤ 70%",
-                payout,
-                status,
-                comment,
-                as_pct=True,
-            )
-        )
-
-    # FCF yield positive
-    if _is_nan(fcf_yield):
-        rules.append(
-            _rule(
-                "FCF yield",
-                "FCF yield ≥ 0%",
-                fcf_yield,
-                "na",
-                "Free cash flow data missing.",
-                as_pct=True,
-            )
-        )
-    else:
-        if fcf_yield >= 0.05:
-            status, comment = "pass", "Strong cash backing for dividends."
-        elif fcf_yield >= 0.0:
-            status, comment = "warn", "Thin cash backing."
-        else:
-            status, comment = "fail", "Negative free cash flow."
-        rules.append(
-            _rule(
-                "FCF yield",
-                "FCF yield ≥ 0%",
-                fcf_yield,
-                status,
-                comment,
-                as_pct=True,
-            )
-        )
-
-    # Debt/Equity guardrail
-    if _is_nan(debt_to_equity):
-        rules.append(
-            _rule(
-                "Leverage",
-                "Debt/Equity ≤ 1.0",
-                debt_to_equity,
-                "na",
-                "Leverage data missing.",
-            )
-        )
-    else:
-        if debt_to_equity <= 0.5:
-            status, comment = "pass", "Conservative balance sheet."
-        elif debt_to_equity <= 1.0:
-            status, comment = "warn", "Moderate leverage."
-        else:
-            status, comment = "fail", "High leverage for dividend safety."
-        rules.append(
-            _rule("Leverage", "Debt/Equity ≤ 1.0", debt_to_equity, status, comment)
-        )
-
-    # Earnings growth >= 0 (avoid shrinking)
-    if _is_nan(earnings_growth):
-        rules.append(
-            _rule(
-                "Earnings growth",
-                "Growth ≥ 0%",
-                earnings_growth,
-                "na",
-                "Earnings growth missing.",
-                as_pct=True,
-            )
-        )
-    else:
-        if earnings_growth >= 0.05:
-            status, comment = "pass", "Growing earnings support dividend growth."
-        elif earnings_growth >= 0.0:
-            status, comment = "warn", "Flat earnings – watch closely."
-        else:
-            status, comment = "fail", "Shrinking earnings – risk to dividend."
-        rules.append(
-            _rule(
-                "Earnings growth",
-                "Growth ≥ 0%",
-                earnings_growth,
-                status,
-                comment,
-                as_pct=True,
-            )
-        )
 
-    summary = _summary_from_rules(rules, "dividend-investor")
-    return {"summary": summary, "rules": rules}
+def dividend_rules(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    return _evaluate(metrics, _DIVIDEND_RULES, "dividend-investor")
 
 
 # ---------- Fisher (Quality Growth) ----------
 
+_FISHER_RULES: Tuple[RuleSpec, ...] = (
+    RuleSpec(
+        name="Revenue growth",
+        condition="Growth ≥ 10%",
+        metric="revenue_growth",
+        thresholds=(0.05, 0.10, 0.15),
+        outcomes=(
+            (FAIL, "Low growth for Fisher-style idea."),
+            (WARN, "Mild growth."),
+            (PASS, "Solid growth."),
+            (PASS, "Strong top-line growth."),
+        ),
+        na_comment="Growth data missing.",
+        as_pct=True,
+        side="right",
+    ),
+    RuleSpec(
+        name="ROE",
+        condition="ROE ≥ 15%",
+        metric="roe",
+        thresholds=(0.10, 0.15, 0.20),
+        outcomes=(
+            (FAIL, "Low ROE for quality growth."),
+            (WARN, "Okay ROE."),
+            (PASS, "Good ROE."),
+            (PASS, "High quality with strong ROE."),
+        ),
+        na_comment="ROE not available.",
+        as_pct=True,
+        side="right",
+    ),
+    RuleSpec(
+        name="Gross margin",
+        condition="Gross margin ≥ 40%",
+        metric="gross_margin",
+        thresholds=(0.30, 0.40),
+        outcomes=(
+            (FAIL, "Low margin for quality growth."),
+            (WARN, "Okay margin."),
+            (PASS, "Indicates product strength."),
+        ),
+        na_comment="Margin data missing.",
+        as_pct=True,
+        side="right",
+    ),
+    RuleSpec(
+        name="Operating margin",
+        condition="Operating margin ≥ 15%",
+        metric="op_margin",
+        thresholds=(0.10, 0.15, 0.20),
+        outcomes=(
+            (FAIL, "Weak operating margin."),
+            (WARN, "Okay margin."),
+            (PASS, "Healthy operating margin."),
+            (PASS, "Strong operating profitability."),
+        ),
+        na_comment="Operating margin missing.",
+        as_pct=True,
+        side="right",
+    ),
+    _leverage_spec(
+        "Debt/Equity ≤ 0.5",
+        "Conservative balance sheet.",
+        "Moderate leverage.",
+        "High leverage for quality growth.",
+    ),
+)
 
-def fisher_rules(metrics: Dict[str, Any]) -> Dict[str, Any]:
-    roe = _get(metrics, "quality", "roe")
-    gross_margin = _get(metrics, "quality", "gross_margin")
-    op_margin = _get(metrics, "quality", "op_margin")
-    rev_g = _get(metrics, "growth", "revenue_growth")
-    debt_to_equity = _get(metrics, "balance_sheet", "debt_to_equity")
-
-    rules: List[Dict[str, Any]] = []
-
-    # Revenue growth ≥ 10%
-    if _is_nan(rev_g):
-        rules.append(
-            _rule(
-                "Revenue growth",
-                "Growth ≥ 10%",
-                rev_g,
-                "na",
-                "Growth data missing.",
-                as_pct=True,
-            )
-        )
-    else:
-        if rev_g >= 0.15:
-            status, comment = "pass", "Strong top-line growth."
-        elif rev_g >= 0.10:
-            status, comment = "pass", "Solid growth."
-        elif rev_g >= 0.05:
-            status, comment = "warn", "Mild growth."
-        else:
-            status, comment = "fail", "Low growth for Fisher-style idea."
-        rules.append(
-            _rule(
-                "Revenue growth",
-                "Growth ≥ 10%",
-                rev_g,
-                status,
-                comment,
-                as_pct=True,
-            )
-        )
-
-    # ROE ≥ 15%
-    if _is_nan(roe):
-        rules.append(
-            _rule(
-                "ROE",
-                "ROE ≥ 15%",
-                roe,
-                "na",
-                "ROE not available.",
-                as_pct=True,
-            )
-        )
-    else:
-        if roe >= 0.20:
-            status, comment = "pass", "High quality with strong ROE."
-        elif roe >= 0.15:
-            status, comment = "pass", "Good ROE."
-        elif roe >= 0.10:
-            status, comment = "warn", "Okay ROE."
-        else:
-            status, comment = "fail", "Low ROE for quality growth."
-        rules.append(
-            _rule("ROE", "ROE ≥ 15%", roe, status, comment, as_pct=True)
-        )
-
-    # Gross margin ≥ 40%
-    if _is_nan(gross_margin):
-        rules.append(
-            _rule(
-                "Gross margin",
-                "Gross margin ≥ 40%",
-                gross_margin,
-                "na",
-                "Margin data missing.",
-                as_pct=True,
-            )
-        )
-    else:
-        if gross_margin >= 0.40:
-            status, comment = "pass", "Indicates product strength."
-        elif gross_margin >= 0.30:
-            status, comment = "warn", "Okay margin."
-        else:
-            status, comment = "fail", "Low margin for quality growth."
-        rules.append(
-            _rule(
-                "Gross margin",
-                "Gross margin ≥ 40%",
-                gross_margin,
-                status,
-                comment,
-                as_pct=True,
-            )
-        )
-
-    # Operating margin ≥ 15%
-    if _is_nan(op_margin):
-        rules.append(
-            _rule(
-                "Operating margin",
-                "Operating margin ≥ 15%",
-                op_margin,
-                "na",
-                "Operating margin missing.",
-                as_pct=True,
-            )
-        )
-    else:
-        if op_margin >= 0.20:
-            status, comment = "pass", "Strong operating profitability."
-        elif op_margin >= 0.15:
-            status, comment = "pass", "Healthy operating margin."
-        elif op_margin >= 0.10:
-            status, comment = "warn", "Okay margin."
-        else:
-            status, comment = "fail", "Weak operating margin."
-        rules.append(
-            _rule(
-                "Operating margin",
-                "Operating margin ≥ 15%",
-                op_margin,
-                status,
-                comment,
-                as_pct=True,
-            )
-        )
-
-    # Debt/Equity ≤ 0.5 (≤1 warning)
-    if _is_nan(debt_to_equity):
-        rules.append(
-            _rule(
-                "Leverage",
-                "Debt/Equity ≤ 0.5",
-                debt_to_equity,
-                "na",
-                "Leverage data missing.",
-            )
-        )
-    else:
-        if debt_to_equity <= 0.5:
-            status, comment = "pass", "Conservative balance sheet."
-        elif debt_to_equity <= 1.0:
-            status, comment = "warn", "Moderate leverage."
-        else:
-            status, comment = "fail", "High leverage for quality growth."
-        rules.append(
-            _rule("Leverage", "Debt/Equity ≤ 0.5", debt_to_equity, status, comment)
-        )
 
-    summary = _summary_from_rules(rules, "Fisher-style growth")
-    return {"summary": summary, "rules": rules}
+def fisher_rules(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    return _evaluate(metrics, _FISHER_RULES, "Fisher-style growth")
 
 
 # ---------- Registry ----------
@@ -1226,6 +892,8 @@ GRAHAM = InvestorProfile(
     category="Deep Value",
     description="Low multiples, strong balance sheet, and classic Ben Graham safeguards.",
     rules_fn=graham_rules,
+    rules=_GRAHAM_RULES,
+    summary_label="Graham",
 )
 
 BUFFETT = InvestorProfile(
@@ -1235,6 +903,8 @@ BUFFETT = InvestorProfile(
     category="Quality",
     description="High-quality, high-ROE businesses with conservative leverage at sensible valuations.",
     rules_fn=buffett_rules,
+    rules=_BUFFETT_RULES,
+    summary_label="Buffett",
 )
 
 LYNCH = InvestorProfile(
@@ -1244,6 +914,8 @@ LYNCH = InvestorProfile(
     category="GARP",
     description="Growth at a reasonable price; PEG around 1 with decent balance sheet.",
     rules_fn=lynch_rules,
+    rules=_LYNCH_RULES,
+    summary_label="Lynch",
 )
 
 GREENBLATT = InvestorProfile(
@@ -1253,6 +925,8 @@ GREENBLATT = InvestorProfile(
     category="Deep Value / Quality",
     description="High earnings yield and high return on capital, Magic Formula style.",
     rules_fn=greenblatt_rules,
+    rules=_GREENBLATT_RULES,
+    summary_label="Greenblatt",
 )
 
 BURRY = InvestorProfile(
@@ -1262,6 +936,8 @@ BURRY = InvestorProfile(
     category="Deep Value",
     description="Cheap on free cash flow with an acceptable balance sheet.",
     rules_fn=burry_rules,
+    rules=_BURRY_RULES,
+    summary_label="Burry",
 )
 
 SMITH = InvestorProfile(
@@ -1271,6 +947,8 @@ SMITH = InvestorProfile(
     category="Quality Growth",
     description="High-margin, high-ROE businesses with reasonable growth and moderate leverage.",
     rules_fn=smith_rules,
+    rules=_SMITH_RULES,
+    summary_label="Smith-style quality",
 )
 
 DIVIDEND = InvestorProfile(
@@ -1280,6 +958,8 @@ DIVIDEND = InvestorProfile(
     category="Income",
     description="Focus on sustainable dividends with reasonable yield, payout, cash flow, and leverage.",
     rules_fn=dividend_rules,
+    rules=_DIVIDEND_RULES,
+    summary_label="dividend-investor",
 )
 
 FISHER = InvestorProfile(
@@ -1289,6 +969,8 @@ FISHER = InvestorProfile(
     category="Growth",
     description="Quality growth: good ROE, strong margins, healthy revenue growth, moderate leverage.",
     rules_fn=fisher_rules,
+    rules=_FISHER_RULES,
+    summary_label="Fisher-style growth",
 )
 
 ALL_PROFILES: List[InvestorProfile] = [
@@ -1302,9 +984,144 @@ ALL_PROFILES: List[InvestorProfile] = [
     FISHER,
 ]
 
+_PROFILES_BY_KEY: Dict[str, InvestorProfile] = {p.key: p for p in ALL_PROFILES}
+
 
 def get_profile_by_key(key: str) -> InvestorProfile:
-    for p in ALL_PROFILES:
-        if p.key == key:
-            return p
-    raise KeyError(f"Unknown profile key: {key}")
+    try:
+        return _PROFILES_BY_KEY[key]
+    except KeyError:
+        raise KeyError(f"Unknown profile key: {key}") from None
+
+
+def evaluate_all(
+    metrics: Dict[str, Any],
+    profiles: Optional[Sequence[InvestorProfile]] = None,
+    want_rules: bool = True,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run several profiles (default: ALL_PROFILES) against one metrics dict.
+
+    Returns {profile.key: profile.rules_fn(metrics)}, but the metrics are
+    flattened once and shared by every built-in profile instead of being
+    re-walked per profile. With want_rules=False each result only has the
+    "summary" entry and no rule dicts are built, which is all a screener
+    needs.
+    """
+    if profiles is None:
+        profiles = ALL_PROFILES
+    values = _extract(metrics)
+    results: Dict[str, Dict[str, Any]] = {}
+    for p in profiles:
+        if not p.rules:
+            result = p.rules_fn(metrics)
+            if not want_rules:
+                result = {"summary": result.get("summary", {})}
+            results[p.key] = result
+        else:
+            results[p.key] = _evaluate_values(
+                values, p.rules, p.summary_label, want_rules=want_rules
+            )
+    return results
+
+
+def is_friendly(profile: InvestorProfile, metrics: Dict[str, Any]) -> bool:
+    """
+    True if `profile` would headline `metrics` as "Very ...-friendly", i.e.
+    no rule fails and at least four pass.
+
+    Stops at the first failing rule (or once four passes are out of reach)
+    and never builds rule dicts, so it's the cheap way to ask a yes/no
+    question of one profile.
+    """
+    if not profile.rules:
+        summary = profile.rules_fn(metrics).get("summary", {})
+        return summary.get("fails", 0) == 0 and summary.get("passes", 0) >= 4
+
+    values = _extract(metrics)
+    passes = 0
+    remaining = len(profile.rules)
+    for spec in profile.rules:
+        code = _classify(spec, values)[0]
+        remaining -= 1
+        if code == _FAIL:
+            return False
+        if code == _PASS:
+            passes += 1
+        elif passes + remaining < 4:
+            return False
+    return passes >= 4
+
+
+# ---------- batch evaluation ----------
+
+
+def _extract_columns(columns: Mapping[str, Any]) -> Dict[str, np.ndarray]:
+    """Columnar _extract: the same flat metrics, one float64 array each."""
+    # Iterating a dict or a DataFrame both yield column names
+    n = len(columns[next(iter(columns))]) if len(columns) else 0
+    values: Dict[str, np.ndarray] = {}
+    for keys in _METRIC_SECTIONS.values():
+        for key in keys:
+            col = columns.get(key)
+            values[key] = (
+                np.full(n, np.nan) if col is None else np.asarray(col, np.float64)
+            )
+
+    # Derived metrics, as in _extract
+    values["graham_product"] = values["pe"] * values["pb"]
+    earn_g = values["earnings_growth"]
+    values["lynch_growth"] = np.where(
+        np.isnan(earn_g), values["revenue_growth"], earn_g
+    )
+    return values
+
+
+def _classify_column(
+    spec: RuleSpec, values: Dict[str, np.ndarray], n: int
+) -> np.ndarray:
+    """Vectorized _classify: one int8 status code per ticker."""
+    codes = np.full(n, _NA, dtype=np.int8)
+    pending = np.ones(n, dtype=bool)
+    # Each fallback only sees the tickers its predecessors had no value for
+    while spec is not None and pending.any():
+        if spec.metric is not None:
+            col = values[spec.metric]
+            hit = pending & ~np.isnan(col)
+            bands = np.searchsorted(spec.thresholds, col[hit], side=spec.side)
+            codes[hit] = np.array(spec.codes, dtype=np.int8)[bands]
+            pending &= ~hit
+        spec = spec.fallback
+    return codes
+
+
+def summarize_batch(
+    columns: Mapping[str, Any], profiles: Optional[Sequence[InvestorProfile]] = None
+) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    Pass/warn/fail counts for many tickers at once.
+
+    `columns` maps metric key -> one value per ticker: the dict from
+    core.metrics.stack_metrics or the DataFrame from metrics_frame.
+
+    Returns {profile.key: {"passes", "warns", "fails"}}, each an int array
+    aligned with the input rows; row i matches the summary rules_fn would
+    give ticker i. Only profiles with a rule table (all built-ins) can be
+    batched.
+    """
+    if profiles is None:
+        profiles = ALL_PROFILES
+    values = _extract_columns(columns)
+    n = len(values["pe"])
+    results: Dict[str, Dict[str, np.ndarray]] = {}
+    for p in profiles:
+        if not p.rules:
+            raise ValueError(f"Profile {p.key!r} has no rule table to batch")
+        # (n_rules, n_tickers) status codes; summaries are column reductions
+        codes = np.stack([_classify_column(spec, values, n) for spec in p.rules])
+        results[p.key] = {
+            "passes": np.count_nonzero(codes == _PASS, axis=0),
+            "warns": np.count_nonzero(codes == _WARN, axis=0),
+            "fails": np.count_nonzero(codes == _FAIL, axis=0),
+        }
+    return results